@@ -18,6 +18,9 @@ from ._impl import (
 
 _error_repr = BaseException.__repr__
 
+# Template for the mismatch reported when a callable fails to raise.
+_RETURNED_TPL = '{!r} returned {!r}'
+
 
 def _is_exception(exc):
     return isinstance(exc, BaseException)
@@ -95,7 +98,7 @@ class Raises(Matcher):
     def match(self, matchee):
         try:
             result = matchee()
-            return Mismatch('{!r} returned {!r}'.format(matchee, result))
+            return Mismatch(_RETURNED_TPL.format(matchee, result))
         # Catch all exceptions: Raises() should be able to match a
         # KeyboardInterrupt or SystemExit.
         except:
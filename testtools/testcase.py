@@ -209,6 +209,17 @@ def unique_text_generator(prefix):
         index = index + 1
 
 
+@functools.lru_cache(maxsize=128)
+def _format_type_names(classes):
+    """Format a tuple of classes as a comma-separated list of their names.
+
+    The same few tuples of expected types tend to recur in a test run, so
+    the joined string is cached.  The cache is bounded to avoid pinning an
+    unbounded number of classes in memory.
+    """
+    return ', '.join(klass.__name__ for klass in classes)
+
+
 class TestCase(unittest.TestCase):
     """Extensions to the basic TestCase.
 
@@ -342,7 +353,7 @@ class TestCase(unittest.TestCase):
         """Format a class or a bunch of classes for display in an error."""
         className = getattr(classOrIterable, '__name__', None)
         if className is None:
-            className = ', '.join(klass.__name__ for klass in classOrIterable)
+            className = _format_type_names(tuple(classOrIterable))
         return className
 
     def addCleanup(self, function, *arguments, **keywordArguments):
@@ -977,6 +988,10 @@ def skipUnless(condition, reason):
     return _id
 
 
+# Template for the error raised when the expected exception never arrives.
+_NOT_RAISED_TPL = '%s not raised.'
+
+
 class ExpectedException:
     """A context manager to handle expected exceptions.
 
@@ -1007,7 +1022,7 @@ class ExpectedException:
 
     def __exit__(self, exc_type, exc_value, traceback):
         if exc_type is None:
-            error_msg = '%s not raised.' % self.exc_type.__name__
+            error_msg = _NOT_RAISED_TPL % self.exc_type.__name__
             if self.msg:
                 error_msg = error_msg + ' : ' + self.msg
             raise AssertionError(error_msg)
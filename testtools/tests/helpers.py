@@ -31,6 +31,10 @@ except Exception:
 class LoggingResult(TestResult):
     """TestResult that logs its event to a list."""
 
+    # The event log is the only attribute we add to TestResult; a slot
+    # keeps its lookup off the instance dict on this hot logging path.
+    __slots__ = ('_events',)
+
     def __init__(self, log):
         self._events = log
         super().__init__()
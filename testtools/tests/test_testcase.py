@@ -63,6 +63,22 @@ from testtools.tests.samplecases import (
 )
 
 
+_SPLIT_HAYSTACK = 'foo bar baz'.split()
+
+
+def _raise_zero_div(ignored):
+    """A cleanup that fails with ZeroDivisionError."""
+    1/0
+
+
+class _Foo:
+    """Simple class for testing assertIsInstance and _formatTypes."""
+
+
+class _Bar:
+    """Another simple class for testing assertIsInstance and _formatTypes."""
+
+
 class TestPlaceHolder(TestCase):
 
     run_test_with = FullStackRunTest
@@ -270,13 +286,14 @@ class TestEquality(TestCase):
     run_test_with = FullStackRunTest
 
     def test_identicalIsEqual(self):
-        # TestCase's are equal if they are identical.
-        self.assertEqual(self, self)
+        # TestCase's are equal if they are identical.  Use the operator
+        # directly so the test exercises TestCase.__eq__ itself.
+        self.assertTrue(self == self)
 
     def test_nonIdenticalInUnequal(self):
         # TestCase's are not equal if they are not identical.
-        self.assertNotEqual(TestCase(methodName='run'),
-            TestCase(methodName='skip'))
+        self.assertTrue(
+            TestCase(methodName='run') != TestCase(methodName='skip'))
 
 
 class TestAssertions(TestCase):
@@ -284,23 +301,20 @@ class TestAssertions(TestCase):
 
     run_test_with = FullStackRunTest
 
+    # Shared by the multiple-exception assertRaises tests.
+    _EXPECTED_EXCEPTIONS = (RuntimeError, ZeroDivisionError)
+
     def raiseError(self, exceptionFactory, *args, **kwargs):
         raise exceptionFactory(*args, **kwargs)
 
     def test_formatTypes_single(self):
         # Given a single class, _formatTypes returns the name.
-        class Foo:
-            pass
-        self.assertEqual('Foo', self._formatTypes(Foo))
+        self.assertEqual('_Foo', self._formatTypes(_Foo))
 
     def test_formatTypes_multiple(self):
         # Given multiple types, _formatTypes returns the names joined by
         # commas.
-        class Foo:
-            pass
-        class Bar:
-            pass
-        self.assertEqual('Foo, Bar', self._formatTypes([Foo, Bar]))
+        self.assertEqual('_Foo, _Bar', self._formatTypes([_Foo, _Bar]))
 
     def test_assertRaises(self):
         # assertRaises asserts that a callable raises a particular exception.
@@ -349,14 +363,12 @@ class TestAssertions(TestCase):
 
         exception = self.assertRaises(RuntimeError, raiseError)
         self.assertEqual(1, len(raisedExceptions))
-        self.assertTrue(
-            exception is raisedExceptions[0],
-            "{!r} is not {!r}".format(exception, raisedExceptions[0]))
+        self.assertIs(exception, raisedExceptions[0])
 
     def test_assertRaises_with_multiple_exceptions(self):
         # assertRaises((ExceptionOne, ExceptionTwo), function) asserts that
         # function raises one of ExceptionTwo or ExceptionOne.
-        expectedExceptions = (RuntimeError, ZeroDivisionError)
+        expectedExceptions = self._EXPECTED_EXCEPTIONS
         self.assertRaises(
             expectedExceptions, self.raiseError, expectedExceptions[0])
         self.assertRaises(
@@ -366,7 +378,7 @@ class TestAssertions(TestCase):
         # If assertRaises is called expecting one of a group of exceptions and
         # a callable that doesn't raise an exception, then fail with an
         # appropriate error message.
-        expectedExceptions = (RuntimeError, ZeroDivisionError)
+        expectedExceptions = self._EXPECTED_EXCEPTIONS
         self.assertRaises(
             self.failureException,
             self.assertRaises, expectedExceptions, lambda: None)
@@ -406,15 +418,18 @@ class TestAssertions(TestCase):
 
     def assertFails(self, message, function, *args, **kwargs):
         """Assert that function raises a failure with the given message."""
-        failure = self.assertRaises(
-            self.failureException, function, *args, **kwargs)
-        self.assertThat(failure, DocTestMatches(message, ELLIPSIS))
+        try:
+            function(*args, **kwargs)
+        except self.failureException as failure:
+            self.assertThat(failure, DocTestMatches(message, ELLIPSIS))
+        else:
+            self.fail('{!r} did not raise a failure'.format(function))
 
     def test_assertIn_success(self):
         # assertIn(needle, haystack) asserts that 'needle' is in 'haystack'.
         self.assertIn(3, range(10))
         self.assertIn('foo', 'foo bar baz')
-        self.assertIn('foo', 'foo bar baz'.split())
+        self.assertIn('foo', _SPLIT_HAYSTACK)
 
     def test_assertIn_failure(self):
         # assertIn(needle, haystack) fails the test when 'needle' is not in
@@ -463,51 +478,30 @@ class TestAssertions(TestCase):
 
     def test_assertIsInstance(self):
         # assertIsInstance asserts that an object is an instance of a class.
-
-        class Foo:
-            """Simple class for testing assertIsInstance."""
-
-        foo = Foo()
-        self.assertIsInstance(foo, Foo)
+        foo = _Foo()
+        self.assertIsInstance(foo, _Foo)
 
     def test_assertIsInstance_multiple_classes(self):
         # assertIsInstance asserts that an object is an instance of one of a
         # group of classes.
-
-        class Foo:
-            """Simple class for testing assertIsInstance."""
-
-        class Bar:
-            """Another simple class for testing assertIsInstance."""
-
-        foo = Foo()
-        self.assertIsInstance(foo, (Foo, Bar))
-        self.assertIsInstance(Bar(), (Foo, Bar))
+        foo = _Foo()
+        self.assertIsInstance(foo, (_Foo, _Bar))
+        self.assertIsInstance(_Bar(), (_Foo, _Bar))
 
     def test_assertIsInstance_failure(self):
         # assertIsInstance(obj, klass) fails the test when obj is not an
         # instance of klass.
-
-        class Foo:
-            """Simple class for testing assertIsInstance."""
-
         self.assertFails(
-            "'42' is not an instance of %s" % self._formatTypes(Foo),
-            self.assertIsInstance, 42, Foo)
+            "'42' is not an instance of %s" % self._formatTypes(_Foo),
+            self.assertIsInstance, 42, _Foo)
 
     def test_assertIsInstance_failure_multiple_classes(self):
         # assertIsInstance(obj, (klass1, klass2)) fails the test when obj is
         # not an instance of klass1 or klass2.
-
-        class Foo:
-            """Simple class for testing assertIsInstance."""
-
-        class Bar:
-            """Another simple class for testing assertIsInstance."""
-
         self.assertFails(
-            "'42' is not an instance of any of (%s)" % self._formatTypes([Foo, Bar]),
-            self.assertIsInstance, 42, (Foo, Bar))
+            "'42' is not an instance of any of (%s)" % self._formatTypes(
+                [_Foo, _Bar]),
+            self.assertIsInstance, 42, (_Foo, _Bar))
 
     def test_assertIsInstance_overridden_message(self):
         # assertIsInstance(obj, klass, msg) permits a custom message.
@@ -770,17 +764,26 @@ class TestAddCleanup(TestCase):
 
     run_tests_with = FullStackRunTest
 
-    def test_cleanup_run_after_tearDown(self):
-        # Cleanup functions added with 'addCleanup' are called after tearDown
-        # runs.
-        log = []
-        test = make_test_case(
+    def make_logging_case(self, log, cleanups=()):
+        """Make a test case that logs setUp, runTest and tearDown to ``log``.
+
+        Most of the tests here only vary in the cleanups they add to this
+        standard case, so build it in one place.
+        """
+        return make_test_case(
             self.getUniqueString(),
             set_up=lambda _: log.append('setUp'),
             test_body=lambda _: log.append('runTest'),
             tear_down=lambda _: log.append('tearDown'),
-            cleanups=[lambda _: log.append('cleanup')],
+            cleanups=cleanups,
         )
+
+    def test_cleanup_run_after_tearDown(self):
+        # Cleanup functions added with 'addCleanup' are called after tearDown
+        # runs.
+        log = []
+        test = self.make_logging_case(
+            log, cleanups=[lambda _: log.append('cleanup')])
         test.run()
         self.assertThat(
             log, Equals(['setUp', 'runTest', 'tearDown', 'cleanup']))
@@ -818,12 +821,8 @@ class TestAddCleanup(TestCase):
         # When this happens, we generally want to clean up the second resource
         # before the first one, since the second depends on the first.
         log = []
-        test = make_test_case(
-            self.getUniqueString(),
-            set_up=lambda _: log.append('setUp'),
-            test_body=lambda _: log.append('runTest'),
-            tear_down=lambda _: log.append('tearDown'),
-            cleanups=[
+        test = self.make_logging_case(
+            log, cleanups=[
                 lambda _: log.append('first'),
                 lambda _: log.append('second'),
             ],
@@ -835,27 +834,17 @@ class TestAddCleanup(TestCase):
     def test_tearDown_runs_on_cleanup_failure(self):
         # tearDown runs even if a cleanup function fails.
         log = []
-        test = make_test_case(
-            self.getUniqueString(),
-            set_up=lambda _: log.append('setUp'),
-            test_body=lambda _: log.append('runTest'),
-            tear_down=lambda _: log.append('tearDown'),
-            cleanups=[lambda _: 1/0],
-        )
+        test = self.make_logging_case(log, cleanups=[_raise_zero_div])
         test.run()
         self.assertThat(log, Equals(['setUp', 'runTest', 'tearDown']))
 
     def test_cleanups_continue_running_after_error(self):
         # All cleanups are always run, even if one or two of them fail.
         log = []
-        test = make_test_case(
-            self.getUniqueString(),
-            set_up=lambda _: log.append('setUp'),
-            test_body=lambda _: log.append('runTest'),
-            tear_down=lambda _: log.append('tearDown'),
-            cleanups=[
+        test = self.make_logging_case(
+            log, cleanups=[
                 lambda _: log.append('first'),
-                lambda _: 1/0,
+                _raise_zero_div,
                 lambda _: log.append('second'),
             ],
         )
@@ -866,7 +855,7 @@ class TestAddCleanup(TestCase):
     def test_error_in_cleanups_are_captured(self):
         # If a cleanup raises an error, we want to record it and fail the the
         # test, even though we go on to run other cleanups.
-        test = make_test_case(self.getUniqueString(), cleanups=[lambda _: 1/0])
+        test = make_test_case(self.getUniqueString(), cleanups=[_raise_zero_div])
         log = []
         test.run(ExtendedTestResult(log))
         self.assertThat(
@@ -926,8 +915,8 @@ class TestAddCleanup(TestCase):
     def test_multipleCleanupErrorsReported(self):
         # Errors from all failing cleanups are reported as separate backtraces.
         test = make_test_case(self.getUniqueString(), cleanups=[
-            lambda _: 1/0,
-            lambda _: 1/0,
+            _raise_zero_div,
+            _raise_zero_div,
         ])
         log = []
         test.run(ExtendedTestResult(log))
@@ -956,8 +945,8 @@ class TestAddCleanup(TestCase):
             test_body=lambda _: raise_(
                 RuntimeError('Deliberately broken test')),
             cleanups=[
-                lambda _: 1/0,
-                lambda _: 1/0,
+                _raise_zero_div,
+                _raise_zero_div,
             ]
         )
         log = []
@@ -1461,6 +1450,16 @@ class TestSkipping(TestCase):
             lambda: self.skipTest("Skip this test"),
             Raises(MatchesException(self.skipException)))
 
+    def run_with_result_events(self, test, result_factory=Python26TestResult):
+        """Run ``test`` against a fresh result, returning the logged events.
+
+        Most tests in this class only inspect the event log, so wiring the
+        list into the result is done in one place.
+        """
+        events = []
+        test.run(result_factory(events))
+        return events
+
     def test_skip_without_reason_works(self):
         class Test(TestCase):
             def test(self):
@@ -1496,11 +1495,9 @@ class TestSkipping(TestCase):
         class SkippingTest(TestCase):
             def test_that_raises_skipException(self):
                 self.skipTest("skipping this test")
-        events = []
-        result = Python27TestResult(events)
         test = SkippingTest("test_that_raises_skipException")
-        test.run(result)
-        case = result._events[0][1]
+        events = self.run_with_result_events(test, Python27TestResult)
+        case = events[0][1]
         self.assertEqual(
             [('startTest', case),
              ('addSkip', case, "skipping this test"),
@@ -1514,11 +1511,9 @@ class TestSkipping(TestCase):
             def test_that_raises_skipException(self):
                 self.skipTest("skipping this test")
 
-        events = []
-        result = Python27TestResult(events)
         test = SkippingTest("test_that_raises_skipException")
-        test.run(result)
-        case = result._events[0][1]
+        events = self.run_with_result_events(test, Python27TestResult)
+        case = events[0][1]
         self.assertEqual(
             [('startTest', case),
              ('addSkip', case, "skipping this test"),
@@ -1535,54 +1530,51 @@ class TestSkipping(TestCase):
             def test_that_raises_skipException(self):
                 pass
 
-        events = []
-        result = Python26TestResult(events)
         test = SkippingTest("test_that_raises_skipException")
-        test.run(result)
+        events = self.run_with_result_events(test)
         self.assertEqual('addSuccess', events[1][0])
 
     def test_skip_with_old_result_object_calls_addError(self):
         class SkippingTest(TestCase):
             def test_that_raises_skipException(self):
                 raise self.skipException("skipping this test")
-        events = []
-        result = Python26TestResult(events)
         test = SkippingTest("test_that_raises_skipException")
-        test.run(result)
+        events = self.run_with_result_events(test)
         self.assertEqual('addSuccess', events[1][0])
 
-    def test_skip_decorator(self):
+    def check_skip_decorator_skips(self, decorator):
+        """Check that a method decorated with ``decorator`` is skipped."""
         class SkippingTest(TestCase):
-            @skip("skipping this test")
-            def test_that_is_decorated_with_skip(self):
+            # Use the decorator passed to us:
+            @decorator
+            def test_skipped(self):
                 self.fail()
-        events = []
-        result = Python26TestResult(events)
-        test = SkippingTest("test_that_is_decorated_with_skip")
-        test.run(result)
+        events = self.run_with_result_events(SkippingTest("test_skipped"))
         self.assertEqual('addSuccess', events[1][0])
 
-    def test_skipIf_decorator(self):
+    def check_skip_class_decorator_skips(self, decorator):
+        """Check that a TestCase decorated with ``decorator`` is skipped."""
+        # Use the decorator passed to us:
+        @decorator
         class SkippingTest(TestCase):
-            @skipIf(True, "skipping this test")
-            def test_that_is_decorated_with_skipIf(self):
+            def test_skipped(self):
                 self.fail()
-        events = []
-        result = Python26TestResult(events)
-        test = SkippingTest("test_that_is_decorated_with_skipIf")
-        test.run(result)
+        try:
+            test = SkippingTest("test_skipped")
+        except TestSkipped:
+            self.fail('TestSkipped raised')
+        events = self.run_with_result_events(test)
         self.assertEqual('addSuccess', events[1][0])
 
-    def test_skipUnless_decorator(self):
-        class SkippingTest(TestCase):
-            @skipUnless(False, "skipping this test")
-            def test_that_is_decorated_with_skipUnless(self):
-                self.fail()
-        events = []
-        result = Python26TestResult(events)
-        test = SkippingTest("test_that_is_decorated_with_skipUnless")
-        test.run(result)
-        self.assertEqual('addSuccess', events[1][0])
+    def test_skip_decorators(self):
+        # skip, skipIf and skipUnless all mark a decorated method as
+        # skipped.
+        for decorator in (
+                skip("skipping this test"),
+                skipIf(True, "skipping this test"),
+                skipUnless(False, "skipping this test"),
+                ):
+            self.check_skip_decorator_skips(decorator)
 
     def test_skip_decorator_shared(self):
         def shared(testcase):
@@ -1594,59 +1586,22 @@ class TestSkipping(TestCase):
         class NotSkippingTest(TestCase):
             test_no_skip = skipIf(False, "skipping this test")(shared)
 
-        events = []
-        result = Python26TestResult(events)
-        test = SkippingTest("test_skip")
-        test.run(result)
+        events = self.run_with_result_events(SkippingTest("test_skip"))
         self.assertEqual('addSuccess', events[1][0])
 
-        events2 = []
-        result2 = Python26TestResult(events2)
-        test2 = NotSkippingTest("test_no_skip")
-        test2.run(result2)
+        events2 = self.run_with_result_events(NotSkippingTest("test_no_skip"))
         self.assertEqual('addFailure', events2[1][0])
 
     def test_skip_class_decorator(self):
-        @skip("skipping this testcase")
-        class SkippingTest(TestCase):
-            def test_that_is_decorated_with_skip(self):
-                self.fail()
-        events = []
-        result = Python26TestResult(events)
-        try:
-            test = SkippingTest("test_that_is_decorated_with_skip")
-        except TestSkipped:
-            self.fail('TestSkipped raised')
-        test.run(result)
-        self.assertEqual('addSuccess', events[1][0])
+        self.check_skip_class_decorator_skips(skip("skipping this testcase"))
 
     def test_skipIf_class_decorator(self):
-        @skipIf(True, "skipping this testcase")
-        class SkippingTest(TestCase):
-            def test_that_is_decorated_with_skipIf(self):
-                self.fail()
-        events = []
-        result = Python26TestResult(events)
-        try:
-            test = SkippingTest("test_that_is_decorated_with_skipIf")
-        except TestSkipped:
-            self.fail('TestSkipped raised')
-        test.run(result)
-        self.assertEqual('addSuccess', events[1][0])
+        self.check_skip_class_decorator_skips(
+            skipIf(True, "skipping this testcase"))
 
     def test_skipUnless_class_decorator(self):
-        @skipUnless(False, "skipping this testcase")
-        class SkippingTest(TestCase):
-            def test_that_is_decorated_with_skipUnless(self):
-                self.fail()
-        events = []
-        result = Python26TestResult(events)
-        try:
-            test = SkippingTest("test_that_is_decorated_with_skipUnless")
-        except TestSkipped:
-            self.fail('TestSkipped raised')
-        test.run(result)
-        self.assertEqual('addSuccess', events[1][0])
+        self.check_skip_class_decorator_skips(
+            skipUnless(False, "skipping this testcase"))
 
     def check_skip_decorator_does_not_run_setup(self, decorator, reason):
         class SkippingTest(TestCase):
@@ -2041,5 +1996,31 @@ class TestDecorateTestCaseResult(TestCase):
 
 
 def test_suite():
-    from unittest import TestLoader
-    return TestLoader().loadTestsFromName(__name__)
+    from unittest import TestLoader, TestSuite
+    loader = TestLoader()
+    # Enumerating the test classes directly skips the module re-import and
+    # dir() scan that loadTestsFromName does to discover them.
+    return TestSuite(
+        loader.loadTestsFromTestCase(test_class)
+        for test_class in (
+            TestAddCleanup,
+            TestAssertions,
+            TestAttributes,
+            TestCloneTestWithNewId,
+            TestDecorateTestCaseResult,
+            TestDetailsProvided,
+            TestEquality,
+            TestErrorHolder,
+            TestExpectedFailure,
+            TestNullary,
+            TestOnException,
+            TestPatchSupport,
+            TestPlaceHolder,
+            TestRunTestUsage,
+            TestRunTwiceDeterminstic,
+            TestRunTwiceNondeterministic,
+            TestSetupTearDown,
+            TestSkipping,
+            TestTestCaseSuper,
+            TestUniqueFactories,
+        ))